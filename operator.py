@@ -1,11 +1,18 @@
 import os
+import json
 import logging
 import kopf
 import threading
+import time
+import concurrent.futures
+from collections import OrderedDict
+import urllib3
+import orjson
 from datetime import datetime, timezone
-from kubernetes import client, config
+from kubernetes import client, config, watch
+from kubernetes.client import rest
 from kubernetes.client.rest import ApiException
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception, retry_if_exception_type
 
 
 # ---------------- Logging Setup ----------------
@@ -19,20 +26,114 @@ logging.getLogger().setLevel(log_level)
 
 LOG = logging.getLogger("aigen-operator")
 LOG.setLevel(log_level)
-LOG.info(f"Logging initialized at level: {log_level}")
+LOG.info("Logging initialized at level: %s", log_level)
 
 # Configurable reconcile interval (default: 60 seconds)
 RECONCILE_INTERVAL = int(os.getenv("RECONCILE_INTERVAL", "60"))
 
+# Window for coalescing bursts of reconcile requests (default: 500 ms)
+DEBOUNCE_MS = int(os.getenv("DEBOUNCE_MS", "500"))
+
+# Upper bound on how long a burst can postpone reconciliation (default: 5 seconds)
+DEBOUNCE_MAX_MS = int(os.getenv("DEBOUNCE_MAX_MS", "5000"))
+
+# Optional label selector limiting which nodes are listed and watched,
+# e.g. a node-pool label; empty means all nodes
+NODE_LABEL_SELECTOR = os.getenv("NODE_LABEL_SELECTOR", "")
+
+# Page size for the node list that seeds the cache (default: 500); only
+# honoured by API servers that do not serve that list from their watch cache
+NODE_LIST_PAGE_SIZE = int(os.getenv("NODE_LIST_PAGE_SIZE", "500"))
+
+# Max pooled HTTP connections shared by all API clients (default: 32)
+API_POOL_MAXSIZE = int(os.getenv("API_POOL_MAXSIZE", "32"))
+
+# Max time reconcile waits for scale calls, and then for the status write
+# (each incl. retries), before moving on (default: 5 seconds)
+SCALE_WAIT_TIMEOUT = float(os.getenv("SCALE_WAIT_TIMEOUT", "5"))
+
+# Per-request timeout for the operator's API calls, in whole seconds since
+# the client ignores float timeouts (default: 10 seconds)
+API_REQUEST_TIMEOUT = int(os.getenv("API_REQUEST_TIMEOUT", "10"))
+
+# Max concurrent node patches in the startup finalizer cleanup (default: 10)
+FINALIZER_CLEANUP_WORKERS = int(os.getenv("FINALIZER_CLEANUP_WORKERS", "10"))
+
+# Server-side timeout for each node watch request, after which the watch
+# is re-established from the last resourceVersion (default: 300 seconds)
+WATCH_TIMEOUT_SECONDS = int(os.getenv("WATCH_TIMEOUT_SECONDS", "300"))
+
+# Delay before re-establishing a failed node watch (default: 5 seconds)
+WATCH_RETRY_DELAY = int(os.getenv("WATCH_RETRY_DELAY", "5"))
+
 # ---------------- CRD Info ----------------
 CRD_GROUP = "infra.whiz.ai"
 CRD_VERSION = "v1"
 CRD_PLURAL = "aigens"
+CRD_KIND = "AIGen"
 OPERATOR_NAMESPACE = os.getenv("OPERATOR_NAMESPACE", "whiz-operator")
 CR_NAME = os.getenv("CR_NAME", "aigen")
 
+# Fixed UTC layout for status.lastSyncTime (same shape as isoformat())
+STATUS_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f+00:00"
+
+# ---------------- Node Detection ----------------
+# Label set by NVIDIA GPU feature discovery, and the extended resource
+# name advertised by the NVIDIA device plugin
+GPU_LABEL = "nvidia.com/gpu.present"
+GPU_RESOURCE = "nvidia.com/gpu"
+
+# Taint effects that keep GPU workloads off a node
+BLOCKING_TAINT_EFFECTS = frozenset(("NoSchedule", "NoExecute"))
+
+# Finalizer that earlier, Kopf-driven versions of this operator put on nodes
+KOPF_FINALIZER = "kopf.zalando.org/KopfFinalizerMarker"
+
+# Node name -> (resourceVersion, is_gpu_node() result), LRU-bounded
+GPU_MEMO = OrderedDict()
+GPU_MEMO_SIZE = 4096
+
 # ---------------- Reconciliation Lock ----------------
-reconcile_lock = threading.Lock()
+reconcile_lock = threading.RLock()
+
+# Set to request a (debounced) reconciliation; the reconcile worker is
+# the only caller of reconcile(), so handlers never contend for the lock
+reconcile_pending = threading.Event()
+
+# Bounded pool for issuing independent API calls concurrently
+EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="aigen-api")
+
+# ---------------- Spec Cache ----------------
+# Spec of the managed CR, kept current by the CR handlers. None means
+# not loaded yet; CR_DELETED means the CR was deleted and must not be
+# refetched (it can still be read while its finalizer is pending).
+CURRENT_SPEC = None
+CR_DELETED = object()
+spec_lock = threading.Lock()
+
+# ---------------- Scale Cache ----------------
+# (namespace, deployment) -> last replica count applied by this operator
+LAST_SCALE = {}
+
+# (namespace, deployment) -> scale_deployment() future still running on
+# EXECUTOR; a deployment is never scaled again while its entry exists
+SCALE_IN_FLIGHT = {}
+scale_flight_lock = threading.RLock()
+
+# ---------------- Status Cache ----------------
+# (deployment, namespace, message, replicas) last written to CR status
+LAST_STATUS = None
+
+# update_status() future submitted by write_status(), possibly still running
+STATUS_IN_FLIGHT = None
+
+# ---------------- Node Cache ----------------
+# Node name -> (change key, GPU capability), kept in sync by the node
+# watch thread. GPU_NODE_COUNT tracks the number of GPU-capable entries.
+NODE_CACHE = {}
+GPU_NODE_COUNT = 0
+node_cache_lock = threading.Lock()
+NODE_CACHE_SYNCED = threading.Event()
 
 
 # ---------------- Kubernetes Client ----------------
@@ -46,20 +147,68 @@ def init_kubernetes_client():
             config.load_kube_config()
             LOG.info("Loaded local kubeconfig")
         except config.ConfigException as ke:
-            LOG.error(f"Failed to load any Kubernetes config: {ke}")
+            LOG.error("Failed to load any Kubernetes config: %s", ke)
             raise RuntimeError("Could not initialize Kubernetes client") from ke
 
 
+def build_api_client():
+    """
+    Build one ApiClient shared by all API groups for the lifetime of the
+    process, so every call reuses the same pooled keep-alive connections.
+    """
+    api_config = client.Configuration.get_default_copy()
+    api_config.connection_pool_maxsize = API_POOL_MAXSIZE
+    
+    # Back off on API server throttling (429) honouring Retry-After; the
+    # last 429 is returned rather than raised so callers still see an
+    # ApiException. A 429 was never acted on, so writes are safe to resend.
+    # Read timeouts and other errors after the request was sent are not
+    # retried (read=0, other=0), so API_REQUEST_TIMEOUT stays per request;
+    # they surface as urllib3 errors rather than ApiException.
+    api_config.retries = urllib3.Retry(
+        total=3,
+        read=0,
+        other=0,
+        backoff_factor=0.2,
+        status_forcelist=[429],
+        allowed_methods=None,
+        raise_on_status=False,
+    )
+    return client.ApiClient(api_config)
+
+
+class OrjsonCodec:
+    """
+    Stand-in for the json module used by kubernetes.client.rest.
+    Request bodies are serialized with orjson; everything else is
+    delegated to the standard library json module.
+    dumps() returns UTF-8 bytes, which are sent unchanged: as a str, raw
+    non-ASCII text would be encoded as Latin-1 by http.client.
+    """
+
+    @staticmethod
+    def dumps(obj, **_):
+        return orjson.dumps(obj)
+
+    def __getattr__(self, attr):
+        return getattr(json, attr)
+
+
 init_kubernetes_client()
 
-core_v1 = client.CoreV1Api()
-apps_v1 = client.AppsV1Api()
-custom_api = client.CustomObjectsApi()
+rest.json = OrjsonCodec()
+api_client = build_api_client()
+core_v1 = client.CoreV1Api(api_client)
+apps_v1 = client.AppsV1Api(api_client)
+custom_api = client.CustomObjectsApi(api_client)
 
 
 # ---------------- Validation Functions ----------------
 def validate_cr_spec(spec):
-    """Validate CR spec has required fields and valid values."""
+    """
+    Validate CR spec has required fields and valid values.
+    Fills in the default replica count, so callers can use spec["replicas"].
+    """
     required_fields = ["targetNamespace", "cpuDeployment", "gpuDeployment"]
     
     for field in required_fields:
@@ -69,83 +218,225 @@ def validate_cr_spec(spec):
     replicas = spec.get("replicas", 1)
     if not isinstance(replicas, int) or replicas < 0:
         raise ValueError(f"Invalid replicas value: {replicas}. Must be non-negative integer.")
+    spec["replicas"] = replicas
     
-    LOG.debug(f"CR spec validated: {spec}")
+    LOG.debug("CR spec validated: %s", spec)
     return True
 
 
 def validate_deployment_exists(name, namespace):
     """Check if deployment exists before attempting to scale it."""
     try:
-        apps_v1.read_namespaced_deployment(name, namespace)
-        LOG.debug(f"Deployment {name} exists in namespace {namespace}")
+        apps_v1.read_namespaced_deployment(name, namespace, _request_timeout=API_REQUEST_TIMEOUT)
+        LOG.debug("Deployment %s exists in namespace %s", name, namespace)
         return True
     except ApiException as e:
         if e.status == 404:
-            LOG.error(f"Deployment {name} not found in namespace {namespace}")
+            LOG.error("Deployment %s not found in namespace %s", name, namespace)
             return False
-        LOG.error(f"Error checking deployment {name}: {e}")
+        LOG.error("Error checking deployment %s: %s", name, e)
         raise
 
 
 # ---------------- Helper Functions ----------------
 def is_gpu_node(node):
+    """
+    Memoized evaluate_gpu_node(), keyed on the node's resourceVersion.
+    An unchanged node object (e.g. seen again in a re-list after a watch
+    reset) is answered from GPU_MEMO without re-running the checks.
+    """
+    metadata = node.get("metadata") or {}
+    name = metadata.get("name")
+    resource_version = metadata.get("resourceVersion")
+    
+    cached = GPU_MEMO.get(name)
+    if cached is not None and cached[0] == resource_version:
+        GPU_MEMO.move_to_end(name)
+        return cached[1]
+    
+    result = evaluate_gpu_node(node)
+    GPU_MEMO[name] = (resource_version, result)
+    GPU_MEMO.move_to_end(name)
+    if len(GPU_MEMO) > GPU_MEMO_SIZE:
+        GPU_MEMO.popitem(last=False)
+    return result
+
+
+def evaluate_gpu_node(node):
     """
     Detect if a node is GPU-capable and schedulable.
+    Takes the raw Node JSON (as a dict) rather than a V1Node model.
     Checks:
     - Node is not cordoned/unschedulable
     - Node has no blocking taints
     - Node is in Ready state
     - Node has GPU resources (labels or allocatable)
     """
-    node_name = node.metadata.name
+    metadata = node.get("metadata") or {}
+    spec = node.get("spec") or {}
+    status = node.get("status") or {}
+    node_name = metadata.get("name")
     
     # Check if node is schedulable
-    if node.spec.unschedulable:
-        LOG.debug(f"Node {node_name} is unschedulable (cordoned)")
+    if spec.get("unschedulable"):
+        LOG.debug("Node %s is unschedulable (cordoned)", node_name)
         return False
     
     # Check for blocking taints
-    taints = node.spec.taints or []
-    for taint in taints:
-        if taint.effect in ["NoSchedule", "NoExecute"]:
-            LOG.debug(f"Node {node_name} has blocking taint: {taint.key}={taint.value}:{taint.effect}")
-            return False
+    taints = spec.get("taints") or []
+    blocking_taint = next((t for t in taints if t.get("effect") in BLOCKING_TAINT_EFFECTS), None)
+    if blocking_taint is not None:
+        LOG.debug("Node %s has blocking taint: %s=%s:%s", node_name,
+                  blocking_taint.get("key"), blocking_taint.get("value"), blocking_taint.get("effect"))
+        return False
     
     # Check node conditions - must be Ready
-    conditions = node.status.conditions or []
-    ready = False
-    for condition in conditions:
-        if condition.type == "Ready":
-            ready = condition.status == "True"
-            break
-    
+    conditions = status.get("conditions") or []
+    ready = next((c.get("status") == "True" for c in conditions if c.get("type") == "Ready"), False)
     if not ready:
-        LOG.debug(f"Node {node_name} is not in Ready state")
+        LOG.debug("Node %s is not in Ready state", node_name)
         return False
     
     # Check for GPU presence via labels
-    labels = node.metadata.labels or {}
-    if labels.get("nvidia.com/gpu.present") == "true":
-        LOG.debug(f"Node {node_name} has GPU label")
+    labels = metadata.get("labels") or {}
+    if labels.get(GPU_LABEL) == "true":
+        LOG.debug("Node %s has GPU label", node_name)
         return True
     
     # Check for GPU allocatable resources
-    allocatable = node.status.allocatable or {}
-    gpu_qty = allocatable.get("nvidia.com/gpu", "0")
+    allocatable = status.get("allocatable") or {}
+    gpu_qty = allocatable.get(GPU_RESOURCE, "0")
     
     try:
         gpu_count = int(gpu_qty)
         if gpu_count > 0:
-            LOG.debug(f"Node {node_name} has {gpu_count} allocatable GPUs")
+            LOG.debug("Node %s has %s allocatable GPUs", node_name, gpu_count)
             return True
     except (ValueError, TypeError):
-        LOG.warning(f"Invalid GPU quantity for node {node_name}: {gpu_qty}")
+        LOG.warning("Invalid GPU quantity for node %s: %s", node_name, gpu_qty)
         return False
     
     return False
 
 
+def get_cached_spec():
+    """
+    Return the cached CR spec, fetching it from the API only when the
+    cache is empty (e.g. the startup fetch failed).
+    Returns None once the CR has been deleted.
+    """
+    global CURRENT_SPEC
+    
+    with spec_lock:
+        spec = CURRENT_SPEC
+    if spec is CR_DELETED:
+        return None
+    if spec is not None:
+        return spec
+    
+    LOG.info("No spec cached for CR %s, fetching it", CR_NAME)
+    spec = dict(get_cr_spec())
+    with spec_lock:
+        # The CR handlers may have stored a newer spec, or deleted the CR,
+        # while this fetch was in flight; only fill an empty cache
+        if CURRENT_SPEC is None:
+            CURRENT_SPEC = spec
+        spec = CURRENT_SPEC
+    return None if spec is CR_DELETED else spec
+
+
+def run_concurrently(*calls, timeout=None):
+    """
+    Run (func, *args) tuples on EXECUTOR and wait for all of them.
+    See wait_all() for results, failures and timeouts.
+    """
+    return wait_all([EXECUTOR.submit(func, *args) for func, *args in calls], timeout=timeout)
+
+
+def wait_all(futures, timeout=None):
+    """
+    Wait for all futures; returns their results in order, re-raising the
+    first failure. Raises concurrent.futures.TimeoutError if they are not
+    all done within timeout seconds; unfinished calls keep running.
+    """
+    _, not_done = concurrent.futures.wait(futures, timeout=timeout)
+    if not_done:
+        raise concurrent.futures.TimeoutError(f"{len(not_done)} call(s) still running after {timeout}s")
+    return [future.result() for future in futures]
+
+
+def scale_in_order(*scales):
+    """
+    Apply (name, namespace, replicas) scales one after another, stopping at
+    the first failure. Callers list the scale-up first, so a deployment is
+    only scaled down once its replacement has been scaled up.
+    """
+    for name, namespace, replicas in scales:
+        scale_deployment(name, namespace, replicas)
+
+
+def submit_scales(*scales):
+    """
+    Submit scale_in_order() for (name, namespace, replicas) tuples on
+    EXECUTOR, tracked in SCALE_IN_FLIGHT under each deployment until done.
+    Nothing is submitted while an earlier scale of any of these deployments
+    is still running (e.g. in retry backoff after a timed-out reconcile), so
+    an older replica count can never land after a newer decision. Returns
+    None in that case, after arranging a reconciliation once it finishes.
+    """
+    keys = [(namespace, name) for name, namespace, _ in scales]
+    with scale_flight_lock:
+        busy = {SCALE_IN_FLIGHT[key] for key in keys if key in SCALE_IN_FLIGHT}
+        if not busy:
+            future = EXECUTOR.submit(scale_in_order, *scales)
+            for key in keys:
+                SCALE_IN_FLIGHT[key] = future
+            future.add_done_callback(lambda done: forget_scale(keys, done))
+            return future
+    
+    rearm_when_done(busy)
+    return None
+
+
+def forget_scale(keys, future):
+    """Done-callback: drop a finished scale call from SCALE_IN_FLIGHT."""
+    with scale_flight_lock:
+        for key in keys:
+            if SCALE_IN_FLIGHT.get(key) is future:
+                del SCALE_IN_FLIGHT[key]
+
+
+def write_status(*status):
+    """
+    Run update_status(*status) on EXECUTOR and wait for it up to
+    SCALE_WAIT_TIMEOUT, so a stalled or retrying status write cannot hold
+    the reconcile worker. While an earlier write is still running nothing
+    is submitted, so an older status can never land after a newer one; in
+    that case, and on timeout, a reconciliation is requested once the
+    running write finishes. Only called from reconcile(), under its lock.
+    """
+    global STATUS_IN_FLIGHT
+    
+    if STATUS_IN_FLIGHT is not None and not STATUS_IN_FLIGHT.done():
+        LOG.info("Earlier CR status write still in progress, reconciling again once it finishes")
+        rearm_when_done([STATUS_IN_FLIGHT])
+        return
+    
+    STATUS_IN_FLIGHT = EXECUTOR.submit(update_status, *status)
+    try:
+        wait_all([STATUS_IN_FLIGHT], timeout=SCALE_WAIT_TIMEOUT)
+    except concurrent.futures.TimeoutError:
+        LOG.warning("CR status write still in progress after %ss, reconciling again once it finishes",
+                    SCALE_WAIT_TIMEOUT)
+        rearm_when_done([STATUS_IN_FLIGHT])
+
+
+def rearm_when_done(futures):
+    """Request a reconciliation as each of the given futures finishes."""
+    for future in futures:
+        future.add_done_callback(lambda _: reconcile_pending.set())
+
+
 def get_cr_spec():
     """Fetch the CR spec for the configured CR name and namespace."""
     try:
@@ -155,56 +446,57 @@ def get_cr_spec():
             namespace=OPERATOR_NAMESPACE,
             plural=CRD_PLURAL,
             name=CR_NAME,
+            _request_timeout=API_REQUEST_TIMEOUT,
         )
         spec = cr.get("spec", {})
         
         if not spec:
             raise ValueError(f"CR {CR_NAME} has no spec defined")
         
-        # Validate the spec
-        validate_cr_spec(spec)
-        
         return spec
     except ApiException as e:
         if e.status == 404:
-            LOG.error(f"CR {CR_NAME} not found in namespace {OPERATOR_NAMESPACE}")
+            LOG.error("CR %s not found in namespace %s", CR_NAME, OPERATOR_NAMESPACE)
         else:
-            LOG.error(f"Error fetching CR: {e}")
+            LOG.error("Error fetching CR: %s", e)
         raise
 
 
 @retry(
     stop=stop_after_attempt(3),
     wait=wait_exponential(multiplier=1, min=2, max=10),
-    retry=retry_if_exception_type(ApiException),
+    retry=retry_if_exception(lambda e: isinstance(e, ApiException) and e.status != 404),
     reraise=True
 )
 def scale_deployment(name, namespace, replicas):
     """
-    Patch the deployment scale to the given replica count.
+    Patch the deployment scale to the given replica count, which must
+    already be a non-negative int (see validate_cr_spec()).
+    Skips all API calls when LAST_SCALE shows the count was already applied;
+    otherwise patches directly, since re-applying the same count is a no-op.
     Includes retry logic for transient failures.
     """
-    replicas = max(int(replicas), 0)
+    cache_key = (namespace, name)
+    
+    if LAST_SCALE.get(cache_key) == replicas:
+        LOG.debug("Deployment %s already scaled to %s replicas by operator, skipping scale", name, replicas)
+        return
+    
+    # Forget the cached count until the patch succeeds: a failed or timed-out
+    # patch may still have been applied, so the next reconcile must re-send
+    LAST_SCALE.pop(cache_key, None)
     
     try:
-        # Get current scale to check if change is needed
-        current_scale = apps_v1.read_namespaced_deployment_scale(name, namespace)
-        current_replicas = current_scale.spec.replicas if current_scale.spec.replicas is not None else 0
-        
-        if current_replicas == replicas:
-            LOG.debug(f"Deployment {name} already at {replicas} replicas, skipping scale")
-            return
-        
-        # Perform the scale operation
         body = {"spec": {"replicas": replicas}}
-        apps_v1.patch_namespaced_deployment_scale(name, namespace, body)
-        LOG.info(f"Scaled {name} in namespace {namespace} → {replicas} replicas")
+        apps_v1.patch_namespaced_deployment_scale(name, namespace, body, _request_timeout=API_REQUEST_TIMEOUT)
+        LAST_SCALE[cache_key] = replicas
+        LOG.info("Scaled %s in namespace %s → %s replicas", name, namespace, replicas)
         
     except ApiException as e:
         if e.status == 404:
-            LOG.error(f"Deployment {name} not found in namespace {namespace}")
+            LOG.error("Deployment %s not found in namespace %s", name, namespace)
         else:
-            LOG.warning(f"Failed to scale deployment {name}: {e.reason} (status: {e.status})")
+            LOG.warning("Failed to scale deployment %s: %s (status: %s)", name, e.reason, e.status)
         raise
 
 
@@ -215,19 +507,20 @@ def scale_deployment(name, namespace, replicas):
     reraise=True
 )
 def update_status(active_deployment, target_ns, message, replicas):
-    """Update CR status without overwriting Kopf-managed fields."""
-    now = datetime.now(timezone.utc).isoformat()
-
-    try:
-        cr = custom_api.get_namespaced_custom_object_status(
-            CRD_GROUP, CRD_VERSION, OPERATOR_NAMESPACE, CRD_PLURAL, CR_NAME
-        )
-        existing_status = cr.get("status", {}) or {}
-    except ApiException as e:
-        if e.status == 404:
-            LOG.warning(f"CR {CR_NAME} not found when updating status")
-            return
-        existing_status = {}
+    """
+    Update CR status without overwriting Kopf-managed fields.
+    Uses server-side apply: only the fields sent here are owned by the
+    "aigen-operator" field manager, everything else is left alone.
+    Skips the API call when LAST_STATUS shows the same values were written.
+    """
+    global LAST_STATUS
+    
+    status_key = (active_deployment, target_ns, message, replicas)
+    if status_key == LAST_STATUS:
+        LOG.debug("CR status unchanged (deployment=%s, replicas=%s), skipping update", active_deployment, replicas)
+        return
+    
+    now = datetime.now(timezone.utc).strftime(STATUS_TIME_FORMAT)
 
     new_values = {
         "lastSyncTime": now,
@@ -236,52 +529,264 @@ def update_status(active_deployment, target_ns, message, replicas):
         "message": message,
         "activeReplicas": replicas,
     }
+    apply_body = {
+        "apiVersion": f"{CRD_GROUP}/{CRD_VERSION}",
+        "kind": CRD_KIND,
+        "metadata": {"name": CR_NAME, "namespace": OPERATOR_NAMESPACE},
+        "status": new_values,
+    }
     
-    # Always update to reflect latest sync time
-    existing_status.update(new_values)
+    # Forget the cached status until the write succeeds: a failed or
+    # timed-out write may still have been applied, so the next one must go out
+    LAST_STATUS = None
 
     try:
-        custom_api.patch_namespaced_custom_object_status(
-            group=CRD_GROUP,
-            version=CRD_VERSION,
-            namespace=OPERATOR_NAMESPACE,
-            plural=CRD_PLURAL,
-            name=CR_NAME,
-            body={"status": existing_status},
-            field_manager="aigen-operator",
+        # patch_namespaced_custom_object_status() always sends merge-patch+json,
+        # so the apply is issued through call_api(); the client JSON-encodes
+        # the dict body for apply-patch+yaml too (JSON is valid YAML)
+        applied = api_client.call_api(
+            "/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}/status",
+            "PATCH",
+            path_params={
+                "group": CRD_GROUP,
+                "version": CRD_VERSION,
+                "namespace": OPERATOR_NAMESPACE,
+                "plural": CRD_PLURAL,
+                "name": CR_NAME,
+            },
+            query_params=[("fieldManager", "aigen-operator"), ("force", True)],
+            header_params={
+                "Accept": "application/json",
+                "Content-Type": "application/apply-patch+yaml",
+            },
+            body=apply_body,
+            response_type="object",
+            auth_settings=["BearerToken"],
+            _return_http_data_only=True,
+            _request_timeout=API_REQUEST_TIMEOUT,
         )
-        LOG.info(f"Updated CR status: deployment={active_deployment}, replicas={replicas}, message={message}")
+        
+        # Only cache what the API server actually stored (e.g. not fields
+        # pruned by a CRD schema lacking them)
+        stored = (applied or {}).get("status") or {}
+        if any(stored.get(field) != value for field, value in new_values.items()):
+            LOG.warning("CR status write not reflected by the API server (got %s), will retry on next reconcile", stored)
+            return
+        LAST_STATUS = status_key
+        LOG.info("Updated CR status: deployment=%s, replicas=%s, message=%s", active_deployment, replicas, message)
     except ApiException as e:
-        LOG.warning(f"Failed to update CR status: {e.reason} (status: {e.status})")
+        if e.status == 404:
+            LOG.warning("CR %s not found when updating status", CR_NAME)
+            return
+        LOG.warning("Failed to update CR status: %s (status: %s)", e.reason, e.status)
         raise
 
 
+# ---------------- Node Watch ----------------
+def node_change_key(node):
+    """
+    Extract the node fields GPU detection depends on.
+    Kubelet heartbeats (lastHeartbeatTime) and other status churn leave
+    this tuple unchanged, so such events can be ignored.
+    """
+    metadata = node.get("metadata") or {}
+    spec = node.get("spec") or {}
+    status = node.get("status") or {}
+    
+    labels = metadata.get("labels") or {}
+    allocatable = status.get("allocatable") or {}
+    # Only blocking taints matter, and their order does not
+    taints = tuple(sorted(
+        (t.get("key") or "", t.get("effect"))
+        for t in (spec.get("taints") or [])
+        if t.get("effect") in BLOCKING_TAINT_EFFECTS
+    ))
+    ready = next((c.get("status") for c in (status.get("conditions") or []) if c.get("type") == "Ready"), None)
+    
+    return (
+        labels.get(GPU_LABEL),
+        allocatable.get(GPU_RESOURCE),
+        bool(spec.get("unschedulable")),
+        taints,
+        ready,
+    )
+
+
+def seed_node_cache():
+    """
+    List all nodes from the API server's watch cache (resourceVersion "0")
+    and rebuild NODE_CACHE, parsing the raw JSON. Requests a reconciliation
+    on the first successful sync, and afterwards when the result differs
+    from the previous cache.
+    Returns the list resourceVersion so the watch can resume from it.
+    """
+    global GPU_NODE_COUNT
+    
+    fresh = {}
+    list_kwargs = {"resource_version": "0"}
+    while True:
+        response = core_v1.list_node(
+            label_selector=NODE_LABEL_SELECTOR,
+            limit=NODE_LIST_PAGE_SIZE,
+            _preload_content=False,
+            _request_timeout=API_REQUEST_TIMEOUT,
+            **list_kwargs,
+        )
+        node_list = orjson.loads(response.data)
+        for node in node_list.get("items") or []:
+            fresh[node["metadata"]["name"]] = (node_change_key(node), is_gpu_node(node))
+        
+        # Continuation requests must not carry a resourceVersion
+        continue_token = node_list["metadata"].get("continue")
+        if not continue_token:
+            break
+        list_kwargs = {"_continue": continue_token}
+    
+    with node_cache_lock:
+        # Reconciles skipped while unsynced are owed a run even when the
+        # first sync finds nothing (an empty cache compares equal)
+        changed = fresh != NODE_CACHE or not NODE_CACHE_SYNCED.is_set()
+        NODE_CACHE.clear()
+        NODE_CACHE.update(fresh)
+        GPU_NODE_COUNT = sum(1 for _, is_gpu in fresh.values() if is_gpu)
+    NODE_CACHE_SYNCED.set()
+    
+    LOG.info("Node cache seeded with %s node(s)", len(fresh))
+    if changed:
+        reconcile_pending.set()
+    return node_list["metadata"]["resourceVersion"]
+
+
+def remove_node_finalizer(node):
+    """Remove the Kopf finalizer from one node; returns True on success."""
+    metadata = node["metadata"]
+    finalizers = metadata.get("finalizers") or []
+    
+    # A JSON patch (list body): a strategic-merge patch would merge the
+    # filtered list into the existing one and keep the marker. The test op
+    # fails the patch rather than drop a finalizer added since the list.
+    body = [
+        {"op": "test", "path": "/metadata/finalizers", "value": finalizers},
+        {"op": "replace", "path": "/metadata/finalizers",
+         "value": [f for f in finalizers if f != KOPF_FINALIZER]},
+    ]
+    try:
+        core_v1.patch_node(metadata["name"], body, _request_timeout=API_REQUEST_TIMEOUT)
+        LOG.debug("Removed Kopf finalizer from node %s", metadata["name"])
+        return True
+    except Exception as e:
+        LOG.warning("Failed to remove finalizer from node %s: %s", metadata["name"], e)
+        return False
+
+
 def remove_node_finalizers():
-    """Remove Kopf finalizers from all nodes to prevent finalizer buildup."""
+    """
+    Remove Kopf finalizers left on nodes by earlier operator versions,
+    which handled node events through Kopf. This version never adds them,
+    so startup() runs this once; without it such nodes could never finish
+    deleting. Nodes are patched concurrently on a pool bounded by
+    FINALIZER_CLEANUP_WORKERS. Best effort: failures are logged, not raised.
+    """
     try:
-        nodes = core_v1.list_node()
-        removed_count = 0
+        response = core_v1.list_node(
+            resource_version="0",
+            _preload_content=False,
+            _request_timeout=API_REQUEST_TIMEOUT,
+        )
+        nodes = orjson.loads(response.data).get("items") or []
+    except Exception as e:
+        LOG.warning("Failed to list nodes for finalizer cleanup: %s", e)
+        return
+    
+    marked = [node for node in nodes if KOPF_FINALIZER in (node["metadata"].get("finalizers") or [])]
+    if not marked:
+        return
+    
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=FINALIZER_CLEANUP_WORKERS, thread_name_prefix="aigen-finalizer"
+    ) as pool:
+        removed_count = sum(pool.map(remove_node_finalizer, marked))
+    
+    if removed_count > 0:
+        LOG.info("Removed Kopf finalizers from %s node(s)", removed_count)
+
+
+def handle_node_event(event_type, node):
+    """
+    Apply a single node watch event to NODE_CACHE.
+    Requests a reconciliation only when a node appears, disappears, or one of the
+    fields returned by node_change_key() changes.
+    """
+    global GPU_NODE_COUNT
+    
+    name = node["metadata"]["name"]
+    
+    if event_type == "DELETED":
+        GPU_MEMO.pop(name, None)
+        with node_cache_lock:
+            previous = NODE_CACHE.pop(name, None)
+            if previous is not None:
+                GPU_NODE_COUNT -= int(previous[1])
+        if previous is None:
+            return
+    else:
+        key = node_change_key(node)
+        previous = NODE_CACHE.get(name)
+        if previous is not None and previous[0] == key:
+            LOG.debug("Node %s %s without GPU-relevant changes, skipping reconciliation", name, event_type)
+            return
         
-        for node in nodes.items:
-            finalizers = node.metadata.finalizers or []
-            kopf_finalizer = 'kopf.zalando.org/KopfFinalizerMarker'
+        is_gpu = is_gpu_node(node)
+        with node_cache_lock:
+            NODE_CACHE[name] = (key, is_gpu)
+            GPU_NODE_COUNT += int(is_gpu) - int(previous[1] if previous else False)
+    
+    LOG.info("Node event detected: %s on node '%s' - triggering reconciliation", event_type, name)
+    reconcile_pending.set()
+
+
+def watch_nodes(resource_version=None):
+    """
+    Keep NODE_CACHE in sync through a long-lived node watch.
+    Watch bookmarks keep the resume resourceVersion fresh, so reconnects
+    rarely need a re-list; when it does expire (410 Gone) the nodes are
+    re-listed. Each watch request is bounded by WATCH_TIMEOUT_SECONDS, with a
+    longer client read timeout, and each re-list by API_REQUEST_TIMEOUT, so a
+    silently dropped connection fails instead of blocking forever.
+    Reconnects after transient failures.
+    """
+    while True:
+        try:
+            if resource_version is None:
+                resource_version = seed_node_cache()
             
-            if kopf_finalizer in finalizers:
-                new_finalizers = [f for f in finalizers if f != kopf_finalizer]
-                body = {"metadata": {"finalizers": new_finalizers if new_finalizers else None}}
+            stream = watch.Watch().stream(
+                core_v1.list_node,
+                label_selector=NODE_LABEL_SELECTOR,
+                resource_version=resource_version,
+                allow_watch_bookmarks=True,
+                timeout_seconds=WATCH_TIMEOUT_SECONDS,
+                _request_timeout=(API_REQUEST_TIMEOUT, WATCH_TIMEOUT_SECONDS + 30),
+            )
+            for event in stream:
+                node = event["raw_object"]
+                resource_version = node["metadata"]["resourceVersion"]
                 
-                try:
-                    core_v1.patch_node(node.metadata.name, body)
-                    removed_count += 1
-                    LOG.debug(f"Removed Kopf finalizer from node {node.metadata.name}")
-                except ApiException as e:
-                    LOG.warning(f"Failed to remove finalizer from node {node.metadata.name}: {e}")
-        
-        if removed_count > 0:
-            LOG.info(f"Removed Kopf finalizers from {removed_count} node(s)")
-            
-    except Exception as e:
-        LOG.warning(f"Failed to clean node finalizers: {e}")
+                # Bookmarks only advance the resume point
+                if event["type"] == "BOOKMARK":
+                    continue
+                handle_node_event(event["type"], node)
+                
+        except ApiException as e:
+            if e.status == 410:
+                LOG.info("Node watch resourceVersion expired, re-listing nodes")
+                resource_version = None
+            else:
+                LOG.warning("Node watch failed: %s (status: %s), retrying in %ss", e.reason, e.status, WATCH_RETRY_DELAY)
+                time.sleep(WATCH_RETRY_DELAY)
+        except Exception as e:
+            LOG.error("Unexpected error in node watch: %s, retrying in %ss", e, WATCH_RETRY_DELAY, exc_info=True)
+            time.sleep(WATCH_RETRY_DELAY)
 
 
 # ---------------- Reconciliation Logic ----------------
@@ -289,97 +794,174 @@ def reconcile():
     """
     Main reconciliation logic with locking to prevent concurrent execution.
     Decides which deployment (CPU or GPU) should be active based on available nodes.
+    Normally only called from reconcile_worker(); use reconcile_pending.set()
+    to request a run.
     """
-    # Prevent concurrent reconciliations
-    if not reconcile_lock.acquire(blocking=False):
-        LOG.debug("Reconciliation already in progress, skipping")
-        return
+    # Serialize with any direct caller; uncontended in normal operation
+    reconcile_lock.acquire()
     
     try:
         LOG.debug("Starting reconciliation")
         
-        # Fetch and validate CR spec
-        spec = get_cr_spec()
+        # Validate the CR spec cached by the CR handlers
+        spec = get_cached_spec()
+        if spec is None:
+            LOG.info("CR %s deleted, skipping reconciliation", CR_NAME)
+            return
+        validate_cr_spec(spec)
+        
         target_ns = spec["targetNamespace"]
         cpu_name = spec["cpuDeployment"]
         gpu_name = spec["gpuDeployment"]
-        replicas = spec.get("replicas", 1)
+        replicas = spec["replicas"]
         
-        # Validate both deployments exist
-        cpu_exists = validate_deployment_exists(cpu_name, target_ns)
-        gpu_exists = validate_deployment_exists(gpu_name, target_ns)
-        
-        if not cpu_exists or not gpu_exists:
-            error_msg = f"Required deployment(s) not found: cpu={cpu_exists}, gpu={gpu_exists}"
-            LOG.error(error_msg)
-            update_status("none", target_ns, error_msg, 0)
+        # Check for GPU and CPU nodes from the watch-maintained cache
+        if not NODE_CACHE_SYNCED.is_set():
+            LOG.info("Node cache not synced yet, skipping reconciliation")
             return
         
-        # Check for GPU and CPU nodes
-        nodes = core_v1.list_node().items
-        gpu_nodes = [n for n in nodes if is_gpu_node(n)]
-        gpu_node_count = len(gpu_nodes)
-        cpu_node_count = len(nodes) - gpu_node_count
+        with node_cache_lock:
+            total_node_count = len(NODE_CACHE)
+            gpu_node_count = GPU_NODE_COUNT
+        cpu_node_count = total_node_count - gpu_node_count
         
-        LOG.info(f"Cluster status: {len(nodes)} total nodes, {gpu_node_count} GPU-Node, {cpu_node_count} CPU-Node")
+        LOG.info("Cluster status: %s total nodes, %s GPU-Node, %s CPU-Node", total_node_count, gpu_node_count, cpu_node_count)
         
         # Decide which deployment to activate
         if gpu_node_count > 0:
-            LOG.info(f"GPU nodes available ({gpu_node_count}), activating GPU deployment")
-            scale_deployment(gpu_name, target_ns, replicas)
-            scale_deployment(cpu_name, target_ns, 0)
-            update_status(
-                gpu_name,
-                target_ns,
-                f"GPU nodes detected: {gpu_node_count}",
-                replicas
-            )
+            LOG.info("GPU nodes available (%s), activating GPU deployment", gpu_node_count)
+            active_name, idle_name = gpu_name, cpu_name
+            message = f"GPU nodes detected: {gpu_node_count}"
         else:
-            LOG.info(f"CPU nodes available ({cpu_node_count} CPU nodes), activating CPU deployment")
-            scale_deployment(gpu_name, target_ns, 0)
-            scale_deployment(cpu_name, target_ns, replicas)
-            update_status(
-                cpu_name,
-                target_ns,
-                f"CPU nodes detected: {cpu_node_count}",
-                replicas
+            LOG.info("CPU nodes available (%s CPU nodes), activating CPU deployment", cpu_node_count)
+            active_name, idle_name = cpu_name, gpu_name
+            message = f"CPU nodes detected: {cpu_node_count}"
+        
+        # Scale the active deployment up before the idle one down, so a
+        # failed scale-up never leaves neither deployment serving. A missing
+        # deployment surfaces as a 404 from the scale patch.
+        future = submit_scales(
+            (active_name, target_ns, replicas),
+            (idle_name, target_ns, 0),
+        )
+        if future is None:
+            LOG.info("Earlier scale calls still in progress, reconciling again once they finish")
+            return
+        try:
+            wait_all([future], timeout=SCALE_WAIT_TIMEOUT)
+        except concurrent.futures.TimeoutError:
+            # Let the calls finish (or fail and evict LAST_SCALE) in the
+            # background and confirm on a follow-up run once they are done
+            LOG.warning("Scaling still in progress after %ss, reconciling again once it finishes", SCALE_WAIT_TIMEOUT)
+            rearm_when_done([future])
+            return
+        except ApiException as e:
+            if e.status != 404:
+                raise
+            cpu_exists, gpu_exists = run_concurrently(
+                (validate_deployment_exists, cpu_name, target_ns),
+                (validate_deployment_exists, gpu_name, target_ns),
             )
+            error_msg = f"Required deployment(s) not found: cpu={cpu_exists}, gpu={gpu_exists}"
+            LOG.error(error_msg)
+            # Only the idle deployment is missing: the active one was already
+            # scaled up before the failed scale-down, so report it as serving
+            if (cpu_exists if active_name == cpu_name else gpu_exists):
+                write_status(active_name, target_ns, error_msg, replicas)
+            else:
+                write_status("none", target_ns, error_msg, 0)
+            return
+        
+        write_status(active_name, target_ns, message, replicas)
         
         LOG.debug("Reconciliation completed successfully")
         
     except ValueError as e:
-        LOG.error(f"Validation error during reconciliation: {e}")
+        LOG.error("Validation error during reconciliation: %s", e)
         try:
-            update_status("error", "", str(e), 0)
-        except:
-            pass
+            write_status("error", "", str(e), 0)
+        except Exception as status_error:
+            LOG.warning("Failed to report validation error in CR status: %s", status_error)
     except ApiException as e:
-        LOG.error(f"Kubernetes API error during reconciliation: {e.reason} (status: {e.status})")
+        LOG.error("Kubernetes API error during reconciliation: %s (status: %s)", e.reason, e.status)
+    except urllib3.exceptions.HTTPError as e:
+        # Timeouts and connection failures; the next run retries
+        LOG.error("Kubernetes API request failed during reconciliation: %s", e)
     except Exception as e:
-        LOG.error(f"Unexpected error during reconciliation: {e}", exc_info=True)
+        LOG.error("Unexpected error during reconciliation: %s", e, exc_info=True)
     finally:
         reconcile_lock.release()
 
 
+def reconcile_worker():
+    """
+    Run reconcile() whenever reconcile_pending is set.
+    Debounces on the trailing edge: the DEBOUNCE_MS window is re-armed
+    while requests keep arriving, so a burst of node events collapses
+    into a single reconciliation after the last one. DEBOUNCE_MAX_MS caps
+    the total delay so a steady event stream cannot postpone it forever.
+    """
+    while True:
+        reconcile_pending.wait()
+        deadline = time.monotonic() + DEBOUNCE_MAX_MS / 1000
+        
+        reconcile_pending.clear()
+        while time.monotonic() < deadline:
+            time.sleep(DEBOUNCE_MS / 1000)
+            if not reconcile_pending.is_set():
+                break
+            reconcile_pending.clear()
+        
+        try:
+            reconcile()
+        except Exception as e:
+            LOG.error("Debounced reconciliation failed: %s", e, exc_info=True)
+
+
 # ---------------- Kopf Event Hooks ----------------
+def is_managed_cr(name, namespace, **_):
+    """Kopf filter: only the configured CR drives this operator."""
+    return name == CR_NAME and namespace == OPERATOR_NAMESPACE
+
+
 @kopf.on.startup()
 def startup(**_):
     """Operator startup handler."""
     LOG.info("=" * 60)
     LOG.info("AIGen Operator Starting")
-    LOG.info(f"Operator Namespace: {OPERATOR_NAMESPACE}")
-    LOG.info(f"CR Name: {CR_NAME}")
-    LOG.info(f"Reconcile Interval: {RECONCILE_INTERVAL}s")
+    LOG.info("Operator Namespace: %s", OPERATOR_NAMESPACE)
+    LOG.info("CR Name: %s", CR_NAME)
+    LOG.info("Reconcile Interval: %ss", RECONCILE_INTERVAL)
+    LOG.info("Debounce Window: %sms (max %sms)", DEBOUNCE_MS, DEBOUNCE_MAX_MS)
+    LOG.info("Node Label Selector: %s", NODE_LABEL_SELECTOR or "<all nodes>")
     LOG.info("=" * 60)
     
-    # Clean up any lingering finalizers from previous runs
+    # Seed the spec cache; CR handlers keep it current afterwards
+    try:
+        get_cached_spec()
+    except (ApiException, ValueError) as e:
+        LOG.error("Initial CR spec fetch failed: %s", e)
+    
+    # Clean up finalizers left on nodes by earlier operator versions
     remove_node_finalizers()
     
-    # Perform initial reconciliation
+    # Seed the node cache, then keep it in sync from a background watch
+    resource_version = None
     try:
-        reconcile()
-    except Exception as e:
-        LOG.error(f"Initial reconciliation failed: {e}")
+        resource_version = seed_node_cache()
+    except ApiException as e:
+        LOG.error("Initial node list failed: %s (status: %s)", e.reason, e.status)
+    
+    threading.Thread(target=reconcile_worker, name="reconcile-worker", daemon=True).start()
+    threading.Thread(
+        target=watch_nodes,
+        args=(resource_version,),
+        name="node-watch",
+        daemon=True,
+    ).start()
+    
+    # Request initial reconciliation
+    reconcile_pending.set()
 
 
 @kopf.on.cleanup()
@@ -388,53 +970,61 @@ def cleanup(**_):
     LOG.info("=" * 60)
     LOG.info("AIGen Operator Shutting Down")
     LOG.info("=" * 60)
-
-
-@kopf.on.event('', 'v1', 'nodes')
-def on_node_event(type, name, **_):
-    """
-    React immediately when nodes are added/removed/modified.
-    This ensures quick response to infrastructure changes.
-    """
-    LOG.info(f"Node event detected: {type} on node '{name}' - triggering reconciliation")
-    reconcile()
     
-    # Clean up any finalizers that may have been added
-    remove_node_finalizers()
+    EXECUTOR.shutdown(wait=False)
 
 
-@kopf.timer(CRD_GROUP, CRD_VERSION, CRD_PLURAL, interval=RECONCILE_INTERVAL, idle=RECONCILE_INTERVAL)
-def periodic_on_cr(spec, **_):
+@kopf.timer(CRD_GROUP, CRD_VERSION, CRD_PLURAL, interval=RECONCILE_INTERVAL, idle=RECONCILE_INTERVAL, when=is_managed_cr)
+async def periodic_on_cr(spec, **_):
     """
     Periodic reconciliation based on CR timer.
-    Ensures system converges to desired state even if events are missed.
+    Re-applies scales and status so out-of-band changes get corrected; it
+    does not re-list nodes. The node watch keeps the cache current, resuming
+    from its resourceVersion and re-listing only on 410 Gone.
     """
-    LOG.debug(f"Periodic reconciliation triggered (interval={RECONCILE_INTERVAL}s)")
-    reconcile()
+    global LAST_STATUS
+    
+    LOG.debug("Periodic reconciliation triggered (interval=%ss)", RECONCILE_INTERVAL)
+    
+    # Re-apply deployment scales so out-of-band changes get corrected,
+    # and rewrite the status so lastSyncTime keeps advancing
+    LAST_SCALE.clear()
+    LAST_STATUS = None
+    reconcile_pending.set()
 
 
-@kopf.on.create(CRD_GROUP, CRD_VERSION, CRD_PLURAL)
-@kopf.on.update(CRD_GROUP, CRD_VERSION, CRD_PLURAL)
-def on_cr_change(spec, old, new, **_):
-    """Reconcile when CR is created or updated."""
+@kopf.on.create(CRD_GROUP, CRD_VERSION, CRD_PLURAL, when=is_managed_cr)
+@kopf.on.update(CRD_GROUP, CRD_VERSION, CRD_PLURAL, when=is_managed_cr)
+async def on_cr_change(spec, old, diff, **_):
+    """Cache the new spec and reconcile when CR is created or updated."""
+    global CURRENT_SPEC, LAST_STATUS
+    
+    # Kopf's precomputed diff is empty for no-op updates
+    if old is not None and not diff:
+        LOG.debug("CR %s updated but spec unchanged", CR_NAME)
+        return
+    
+    with spec_lock:
+        CURRENT_SPEC = dict(spec)
+    LAST_STATUS = None
+    
     if old is None:
-        LOG.info(f"CR {CR_NAME} created - triggering reconciliation")
-    else:
-        # Log what changed
-        changed_fields = []
-        for key in spec.keys():
-            if old.get(key) != new.get(key):
-                changed_fields.append(key)
-        
-        if changed_fields:
-            LOG.info(f"CR {CR_NAME} updated (changed: {', '.join(changed_fields)}) - triggering reconciliation")
-        else:
-            LOG.debug(f"CR {CR_NAME} updated but spec unchanged")
+        LOG.info("CR %s created - triggering reconciliation", CR_NAME)
+    elif LOG.isEnabledFor(logging.INFO):
+        # Log what changed (only computed when it will be logged)
+        changed_fields = [".".join(field) for _, field, _, _ in diff if field]
+        LOG.info("CR %s updated (changed: %s) - triggering reconciliation", CR_NAME, ", ".join(changed_fields))
     
-    reconcile()
+    reconcile_pending.set()
 
 
-@kopf.on.delete(CRD_GROUP, CRD_VERSION, CRD_PLURAL)
-def on_cr_delete(**_):
+@kopf.on.delete(CRD_GROUP, CRD_VERSION, CRD_PLURAL, when=is_managed_cr)
+async def on_cr_delete(**_):
     """Handle CR deletion."""
-    LOG.info(f"CR {CR_NAME} deleted - operator will stop managing deployments")
\ No newline at end of file
+    global CURRENT_SPEC, LAST_STATUS
+    
+    with spec_lock:
+        CURRENT_SPEC = CR_DELETED
+    LAST_STATUS = None
+    
+    LOG.info("CR %s deleted - operator will stop managing deployments", CR_NAME)
\ No newline at end of file